@@ -4,8 +4,40 @@ Extract a high quality AVIF frame from a video.
 
 """
 
+import asyncio
+import os
+
 from pathlib import Path
-from subprocess import run
+from subprocess import DEVNULL, PIPE, CalledProcessError, run
+
+
+def _frame_cmd(
+    video_path: Path, timestamp: str, output_path: Path | str, crf: int, speed: int
+) -> list[str]:
+    """Builds the ffmpeg command to extract a single AVIF frame."""
+    return [
+        "ffmpeg",
+        "-nostdin",  # Never wait on stdin
+        "-ss",
+        timestamp,  # Seek to timestamp (before -i, so it seeks by keyframe)
+        "-i",
+        str(video_path),  # Input file
+        "-frames:v",
+        "1",  # Extract one frame
+        "-an",  # Skip audio
+        "-sn",  # Skip subtitles
+        "-update",
+        "1",  # Write a single image
+        "-c:v",
+        "libaom-av1",  # AVIF codec
+        "-crf",
+        str(crf),  # Quality
+        "-cpu-used",
+        str(speed),  # Encoding speed
+        "-still-picture",
+        "1",  # Still image coding; tiling and row-mt don't help a single frame
+        str(output_path),
+    ]
 
 
 def extract_frame_avif(
@@ -30,26 +62,63 @@ def extract_frame_avif(
     video_path = Path(video_path)
     if output_path is None:
         output_path = video_path.with_suffix(".avif")
-
-    cmd = [
-        "ffmpeg",
-        "-ss",
-        timestamp,  # Seek to timestamp
-        "-i",
-        str(video_path),  # Input file
-        "-vframes",
-        "1",  # Extract one frame
-        "-c:v",
-        "libaom-av1",  # AVIF codec
-        "-crf",
-        str(crf),  # Quality
-        "-cpu-used",
-        str(speed),  # Encoding speed
-        "-row-mt",
-        "1",  # Row-based multithreading
-        "-tiles",
-        "2x2",  # Tile configuration
-        str(output_path),
-    ]
+    cmd = _frame_cmd(video_path, timestamp, output_path, crf, speed)
     run(cmd, capture_output=True, check=True)  # noqa: S603
     return Path(output_path)
+
+
+async def extract_frame_avif_async(
+    video_path: Path | str,
+    timestamp: str = "00:00:10",
+    output_path: Path | str | None = None,
+    crf: int = 20,
+    speed: int = 4,
+) -> Path:
+    """Async version of `extract_frame_avif`; takes the same arguments.
+
+    Raises:
+        CalledProcessError: If ffmpeg exits with a non-zero status
+    """
+    video_path = Path(video_path)
+    if output_path is None:
+        output_path = video_path.with_suffix(".avif")
+    cmd = _frame_cmd(video_path, timestamp, output_path, crf, speed)
+    proc = await asyncio.create_subprocess_exec(*cmd, stdout=DEVNULL, stderr=PIPE)
+    _, stderr = await proc.communicate()
+    if proc.returncode:
+        raise CalledProcessError(proc.returncode, cmd, stderr=stderr)
+    return Path(output_path)
+
+
+async def extract_frames_batch(
+    videos: list[Path | str],
+    timestamp: str = "00:00:10",
+    crf: int = 20,
+    speed: int = 4,
+    concurrency: int | None = None,
+) -> list[Path]:
+    """Extract an AVIF frame from each video, running several ffmpeg processes at once.
+
+    ffmpeg is already multithreaded, so by default we only run half as many
+    processes as there are CPUs.
+
+    Args:
+        videos: Paths to the video files; each frame is saved next to its video
+        timestamp: Timestamp in HH:MM:SS format
+        crf: AVIF quality (0-63, lower is better quality)
+        speed: AVIF encoding speed (0-8, higher is faster)
+        concurrency: Maximum number of ffmpeg processes to run at once
+
+    Returns:
+        Paths to the extracted AVIF frames, in the same order as `videos`
+
+    Examples:
+        frames = asyncio.run(extract_frames_batch([Path("hero.mp4"), Path("other.mp4")]))
+    """
+    semaphore = asyncio.Semaphore(concurrency or max((os.cpu_count() or 2) // 2, 1))
+
+    async def extract(video: Path | str) -> Path:
+        async with semaphore:
+            return await extract_frame_avif_async(video, timestamp, crf=crf, speed=speed)
+
+    return list(await asyncio.gather(*(extract(video) for video in videos)))
@@ -2,10 +2,11 @@
 Generates a JSON file with the hero images/videos paths and their parent. Copies the JSON to the clipboard. Used to fill the hero config.
 """
 
-import json
+import os
 
 from pathlib import Path
 
+import orjson
 import pyperclip
 
 
@@ -17,7 +18,9 @@ def get_ending(x: str) -> str:
 def generate_hero_json(hero_folder_path: Path) -> str:
     """Generates a JSON file with the hero images paths and their parent."""
     hero_folder = Path(hero_folder_path)
-    hero_names = [hero.name for hero in hero_folder.iterdir() if hero.is_dir()]
+    # DirEntry caches the type info from the directory read, so no extra stat() per entry
+    with os.scandir(hero_folder) as entries:
+        hero_names = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
 
     heroes = {hero: {"paths": None, "parent": None, "widths": {}} for hero in hero_names}
 
@@ -25,21 +28,14 @@ def generate_hero_json(hero_folder_path: Path) -> str:
         hero_path = hero_folder / hero
         hero_info = heroes[hero]
         hero_info["parent"] = str(hero_path)
-        hero_info["paths"] = [
-            str(hero_path / image) for image in hero_path.iterdir() if image.is_file()
-        ]
-        present_widths = [
-            int(get_ending(hero))
-            for hero in hero_info["paths"]
-            for image in (hero_folder / hero).iterdir()
-            if image.is_file()
-        ]
-        widths = {k: None for k in present_widths}
-        for k in widths:
-            widths[k] = next((str(image) for image in hero_info["paths"] if str(k) in image), None)
-            hero_info["widths"] = widths
-
-    return json.dumps(heroes, indent=2)
+        with os.scandir(hero_path) as entries:
+            hero_info["paths"] = [entry.path for entry in entries if entry.is_file()]
+        widths: dict[int, str] = {}
+        for path in hero_info["paths"]:
+            widths.setdefault(int(get_ending(Path(path).stem)), path)
+        hero_info["widths"] = widths
+
+    return orjson.dumps(heroes, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
 
 
 def main() -> None:
@@ -3,10 +3,12 @@ Utility functions for hooks.
 """
 
 import os
+import subprocess
 
+from functools import cache, cached_property
 from pathlib import Path
 from textwrap import wrap
-from typing import ClassVar, Literal, Self
+from typing import Literal
 
 from funcy import rpartial
 from mkdocs.structure.pages import Page
@@ -14,10 +16,26 @@ from mkdocs.structure.pages import Page
 
 type MkDocsCommand = Literal["gh-deploy", "serve", "build"]
 
+# category and main info pages to exclude from the expected licenses
+_NON_LICENSE_PAGES = frozenset({
+    "copyleft",
+    "licenses",
+    "permissive",
+    "proprietary",
+    "public-domain",
+    "source-available",
+})
+
+_wrapper = rpartial(wrap, width=70, break_long_words=False)
+
+# deletes markdown emphasis, code, and header characters in one pass
+_MARKDOWN_STRIP_TABLE = str.maketrans("", "", "*`#")
+
 
 def wrap_text(text: str) -> str:
     """
-    Wraps the provided text into formatted paragraphs, handling bullet points separately.
+    Wraps the provided text into formatted paragraphs. Each line is wrapped on its own, so
+    bullet points keep their line breaks.
 
     Args:
         text (str): The text to be wrapped into formatted paragraphs.
@@ -25,28 +43,11 @@ def wrap_text(text: str) -> str:
     Returns:
         str: The wrapped text with paragraphs and bullet points formatted appropriately.
     """
-    wrapper = rpartial(wrap, width=70, break_long_words=False)
-    paragraphs = text.split("\n\n")
-    bullet_paragraphs = []
-    for i, paragraph in enumerate(paragraphs):
-        if paragraph.strip().startswith("-"):
-            bullets = paragraph.split("\n")
-            bullets = [wrapper(bullet) for bullet in bullets if bullet]
-            bullet_paragraphs.append((i, bullets))
-        else:
-            lines = paragraph.split("\n")
-            wrapped_lines = [wrapper(line) for line in lines if line]
-            bullet_paragraphs.append((i, wrapped_lines))
-    paragraphs = [
-        paragraph
-        for i, paragraph in enumerate(paragraphs)
-        if i not in [i for i, _ in bullet_paragraphs]
-    ]
-    wrapped_paragraphs = ["\n".join(wrapper(paragraph)) for paragraph in paragraphs]
-    for i, bullets in bullet_paragraphs:
-        bullets = ["\n".join(bullet) for bullet in bullets if bullet]
-        wrapped_paragraphs.insert(i, "\n".join(bullets))
-    return "\n\n".join(wrapped_paragraphs)
+    paragraphs = []
+    for paragraph in text.split("\n\n"):
+        wrapped_lines = (_wrapper(line) for line in paragraph.split("\n") if line)
+        paragraphs.append("\n".join("\n".join(lines) for lines in wrapped_lines if lines))
+    return "\n\n".join(paragraphs)
 
 
 def strip_markdown(text: str) -> str:
@@ -59,12 +60,15 @@ def strip_markdown(text: str) -> str:
     Returns:
         str: The text with markdown stripped.
     """
-    return text.replace("**", "").replace("*", "").replace("`", "").replace("#", "")
+    return text.translate(_MARKDOWN_STRIP_TABLE)
 
 
+@cache
 def find_repo_root() -> Path:
     """
-    Find the repository's root directory by looking for the .git directory.
+    Find the repository's root directory. Uses GITHUB_WORKSPACE in CI, then git, then
+    falls back to walking up from the current directory looking for the .git directory.
+    The result is cached for the life of the build.
 
     Returns:
         Path: The path to the repository's root directory.
@@ -72,6 +76,18 @@ def find_repo_root() -> Path:
     Raises:
         FileNotFoundError: If the repository root directory cannot be found.
     """
+    if workspace := os.getenv("GITHUB_WORKSPACE"):
+        return Path(workspace)
+    try:
+        return Path(
+            subprocess.check_output(
+                ["git", "rev-parse", "--show-toplevel"],  # noqa: S607
+                text=True,
+                stderr=subprocess.DEVNULL,
+            ).strip()
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
     current_path = Path.cwd()
     while not (current_path / ".git").exists():
         if current_path.parent == current_path and current_path.stem != "PlainLicense":
@@ -82,9 +98,39 @@ def find_repo_root() -> Path:
     return current_path
 
 
+def _find_license_dirs(root: str) -> frozenset[str]:
+    """
+    Returns the names of the license directories under root.
+
+    Licenses always live at `<root>/<category>/<license>/index.md`, so we only
+    scan two levels deep with os.scandir instead of globbing the whole tree.
+
+    Args:
+        root (str): The licenses docs directory.
+
+    Returns:
+        frozenset[str]: The names of the license directories found.
+    """
+    found: list[str] = []
+    with os.scandir(root) as categories:
+        for category in categories:
+            if not category.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(category.path) as licenses:
+                found.extend(
+                    entry.name
+                    for entry in licenses
+                    if entry.is_dir(follow_symlinks=False)
+                    and entry.name not in _NON_LICENSE_PAGES
+                    and os.path.isfile(os.path.join(entry.path, "index.md"))  # noqa: PTH113, PTH118
+                )
+    return frozenset(found)
+
+
+@cache
 def _is_production(command: MkDocsCommand) -> bool:
     """
-    Returns True if the environment is production.
+    Returns True if the environment is production. Neither input changes during a build, so we cache it.
     """
     return command in {"build", "gh-deploy"} or os.getenv("GITHUB_ACTIONS") == "true"
 
@@ -93,57 +139,29 @@ def is_license_page(page: Page) -> bool:
     """
     Returns True if the page is a license page.
     """
-    _status = Status.status()
-    page_name = page.url.split("/")[-2] if len(page.url.split("/")) > 2 else ""
-    try:
-        return bool(page_name and page_name in _status.expected_licenses)  # type: ignore
-    except AttributeError as e:
-        raise AttributeError("Status not initialized.") from e  # noqa: TRY003
+    if (status := get_status()) is None:
+        raise AttributeError("Status not initialized.")  # noqa: TRY003
+    parts = page.url.rsplit("/", 2)
+    page_name = parts[-2] if len(parts) == 3 else ""
+    return bool(page_name and page_name in status.expected_licenses)
 
 
 class Status:
     """
-    Simple singleton class to store global status information.
+    Simple class to store global status information. Use `get_status` to get the build's instance.
     """
 
-    _instance: ClassVar["Status | None"] = None
-    _initialized: ClassVar[bool] = False
-
-    def __new__(cls: type[Self], cmd: MkDocsCommand) -> "Status":
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(self, cmd: MkDocsCommand) -> None:
         """Get this party started."""
-        if type(self)._initialized:  # noqa: SLF001
-            return
         self.command: MkDocsCommand = cmd
         self._production: bool = _is_production(cmd)
-        self._expected_licenses: tuple[str, ...] | None = None
-        type(self)._initialized = True  # noqa: SLF001
 
-    @property
-    def expected_licenses(self) -> tuple[str, ...]:
+    @cached_property
+    def expected_licenses(self) -> frozenset[str]:
         """
-        Returns the list of expected licenses based on the directory structure.
+        Returns the set of expected licenses based on the directory structure.
         """
-        if not self._expected_licenses:
-            license_paths = Path("docs/licenses/").glob("**/index.md")
-            self._expected_licenses = tuple(
-                path.parent.name
-                for path in license_paths
-                if path.parent.name
-                not in {  # category and main info pages to exclude
-                    "copyleft",
-                    "licenses",
-                    "permissive",
-                    "proprietary",
-                    "public-domain",
-                    "source-available",
-                }
-            )
-        return self._expected_licenses
+        return _find_license_dirs("docs/licenses")
 
     @property
     def production(self) -> bool:
@@ -152,15 +170,27 @@ class Status:
         """
         return self._production
 
-    @classmethod
-    def status(cls) -> "Status | None":
-        """
-        Returns the instance.
-        """
-        return cls._instance
-
     def is_expected(self, license_name: str) -> bool:
         """
         Returns True if the license is expected.
         """
-        return license_name in self.expected_licenses if self.expected_licenses else False
+        return license_name in self.expected_licenses
+
+
+_STATUS: Status | None = None
+
+
+def get_status(cmd: MkDocsCommand | None = None) -> Status | None:
+    """
+    Returns the build's Status, creating it on the first call that passes a command.
+
+    Args:
+        cmd (MkDocsCommand | None): The mkdocs command; only needed the first time.
+
+    Returns:
+        Status | None: The build's Status, or None if it hasn't been created yet.
+    """
+    global _STATUS
+    if _STATUS is None and cmd is not None:
+        _STATUS = Status(cmd)
+    return _STATUS
@@ -2,14 +2,16 @@
 
 import json
 import logging
+import threading
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import markdown
 
-from _utils import Status
-from funcy import rpartial
-from hook_logger import get_logger
+from _utils import get_status
+from hook_logger import FILE_ONLY, FILEHANDLER_ENABLED, get_logger
 from jinja2 import Environment
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.plugins import event_priority
@@ -25,27 +27,53 @@ if not hasattr(__name__, "env_logger"):
     env_logger = get_logger(__name__, logging.WARNING)
 
 
-def md_filter(text: str, config: MkDocsConfig) -> str:
-    """Adds markdown filter to Jinja2 environment using markdown extensions and configurations from the mkdocs.yml file."""
-    md = markdown.Markdown(
-        extensions=config["markdown_extensions"] or [],
-        extension_configs=config["mdx_configs"] or {},
-    )
-    return md.convert(text)
+def make_md_filter(
+    extensions: list[str], extension_configs: dict[str, Any]
+) -> Callable[[str], str]:
+    """
+    Returns a markdown filter for the Jinja2 environment using markdown extensions and configurations from the mkdocs.yml file.
+
+    Building a Markdown instance loads every extension, so we build one per thread and `reset()` it between calls.
+    """
+    local = threading.local()
+
+    def md_filter(text: str) -> str:
+        """Converts markdown text to html."""
+        md: markdown.Markdown | None = getattr(local, "md", None)
+        if md is None:
+            md = local.md = markdown.Markdown(
+                extensions=extensions, extension_configs=extension_configs
+            )
+        return md.reset().convert(text)
+
+    return md_filter
+
+
+# replaces the "docs/" prefix in bundler paths, keyed by production status
+_SERVER_PREFIXES = {True: "https://plainlicense.org/", False: "http://127.0.0.1:8000/"}
+
+_build_meta_cache: tuple[float, dict[str, str]] | None = None
 
 
 def get_build_meta_values() -> dict[str, str]:
     """
     Uses the buildmeta.json file, which is generated by the
     javascript/css bundler, to get the values for the css and js bundles.
+
+    The parsed values are cached until the bundler rewrites the file.
     """
-    status = Status.status()
-    production = status.production if status else False
+    global _build_meta_cache
     path = Path("overrides/buildmeta.json")
-    server = "https://plainlicense.org" if production else "http://127.0.0.1:8000"
-    json_data = json.loads(path.read_text())
+    mtime = path.stat().st_mtime
+    if _build_meta_cache and _build_meta_cache[0] == mtime:
+        return _build_meta_cache[1]
+    status = get_status()
+    production = status.production if status else False
+    json_data = json.loads(path.read_bytes())
     img_element: str = json_data["noScriptImage"]
-    json_data["noScriptImage"] = img_element.replace("docs/", f"{server}/")
+    if "docs/" in img_element:
+        json_data["noScriptImage"] = img_element.replace("docs/", _SERVER_PREFIXES[production])
+    _build_meta_cache = (mtime, json_data)
     return json_data
 
 
@@ -53,30 +81,39 @@ def get_build_meta_values() -> dict[str, str]:
 def on_env(env: Environment, config: MkDocsConfig, files: Files) -> Environment:
     """
     Adds markdown filter to Jinja2 environment using markdown extensions and configurations from the mkdocs.yml file.
-    Also adds Jinja2 extensions: do, loopcontrols.
+    Also adds Jinja2 extensions: do, loopcontrols, and debug (outside of production).
     """
-    config_exts = config["markdown_extensions"]
-    extension_tuples = [
-        (item, None) if isinstance(item, str) else item.items() for item in config_exts
-    ]
-    markdown_configs = {item[0]: item[1] for item in extension_tuples}
-    extensions = list(markdown_configs.keys())
-
-    # we have to pass the extensions each time for pyMarkdown, and
-    # env.filters doesn't allow for that... rpartial to the rescue!
-    env.filters["markdown"] = rpartial(md_filter, config)
+    markdown_configs: dict[str, Any] = dict(config["mdx_configs"] or {})
+    extensions: list[str] = []
+    for item in config["markdown_extensions"] or []:
+        if isinstance(item, str):
+            extensions.append(item)
+            continue
+        for name, ext_config in item.items():
+            extensions.append(name)
+            if ext_config:
+                markdown_configs[name] = ext_config
+
+    env.filters["markdown"] = make_md_filter(extensions, markdown_configs)
     env.add_extension("jinja2.ext.do")
     env.add_extension("jinja2.ext.loopcontrols")
-    env.add_extension("jinja2.ext.debug")
+    status = get_status()
+    if not (status and status.production):
+        env.add_extension("jinja2.ext.debug")
     build_updates = get_build_meta_values()
-    env.globals["no_script_image"] = str(build_updates["noScriptImage"])  # type: ignore
-    env.globals["css_bundle"] = build_updates["CSSBUNDLE"]  # type: ignore
-    env.globals["js_bundle"] = build_updates["SCRIPTBUNDLE"]  # type: ignore
-    env.globals["logo_named"] = build_updates["LOGONAMED"]  # type: ignore
+    env.globals.update({
+        "no_script_image": build_updates["noScriptImage"],
+        "css_bundle": build_updates["CSSBUNDLE"],
+        "js_bundle": build_updates["SCRIPTBUNDLE"],
+        "logo_named": build_updates["LOGONAMED"],
+    })
     logger = env_logger.getChild("on_env")
     env_logger.info(
         "Added Jinja extensions: do, loopcontrols and filters: markdown to jinja environment."
     )
-    logger.debug("Markdown extensions: %s", extensions)
-    logger.debug("Environment globals: %s", env.globals)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Markdown extensions: %s", extensions)
+        logger.debug("Environment globals (%d): %s", len(env.globals), ", ".join(env.globals))
+        if FILEHANDLER_ENABLED:
+            logger.debug("Environment globals: %s", env.globals, extra=FILE_ONLY)
     return env
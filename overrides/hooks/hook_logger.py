@@ -7,40 +7,96 @@ If you are only interested in a special logger, set that logger's
 level to the desired level... the lower level will be used.
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
 
 from datetime import UTC, datetime
 from pathlib import Path
 from pprint import pformat
-from typing import ClassVar
+from typing import Any, ClassVar
 
 import click
 
-from _utils import MkDocsCommand, Status
+from _utils import MkDocsCommand, get_status
+from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.plugins import event_priority
 
 
 # Configuration
-override = os.getenv("LOG_LEVEL_OVERRIDE")
-LOG_LEVEL_OVERRIDE = int(override) if override else logging.WARNING
-PRODUCTION = Status.production
-FILEHANDLER_ENABLED = os.getenv("FILEHANDLER_ENABLED", "false").lower() == "true" or not PRODUCTION
+_override = os.getenv("LOG_LEVEL_OVERRIDE")
+LOG_LEVEL_OVERRIDE = int(_override) if _override else logging.WARNING
+# handlers pass everything through unless the override asks for more detail than INFO,
+# and the file log never drops below INFO
+_HANDLER_LEVEL = LOG_LEVEL_OVERRIDE if LOG_LEVEL_OVERRIDE < logging.INFO else logging.NOTSET
+_FILE_LEVEL = min(_HANDLER_LEVEL, logging.INFO)
+# file logging is opt-in; we can't check Status here because it isn't created until on_startup
+FILEHANDLER_ENABLED = os.getenv("FILEHANDLER_ENABLED", "false").lower() == "true"
 STREAMHANDLER_ENABLED = os.getenv("STREAMHANDLER_ENABLED", "true").lower() == "true"
 if FILEHANDLER_ENABLED:
-    base_path = Path(os.getenv("LOG_PATH", ".workbench/logs"))
+    LOG_SAVE_PATH = (
+        Path(os.getenv("LOG_PATH", ".workbench/logs"))
+        / f"pl_build_log_{datetime.now(UTC).isoformat(timespec='seconds')}.log"
+    )
+    LOG_SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    filename = f"pl_build_log_{datetime.now(UTC).isoformat(timespec='seconds')}.log"
+# our formatters don't use thread, process, or task info, so don't collect it for every record
+logging.logThreads = logging.logProcesses = False
+logging.logMultiprocessing = logging.logAsyncioTasks = False
+if LOG_LEVEL_OVERRIDE >= logging.INFO:
+    # unless we're debugging, also skip the stack walk that finds each record's source file
+    logging._srcfile = None  # noqa: SLF001
 
-    LOG_SAVE_PATH = Path(f"{base_path}/{filename}")
-    LOG_SAVE_PATH.parent.mkdir(parents=True, exist_ok=True)
+# pass as `extra` to send a record only to the log file, like full dumps of large objects
+FILE_ONLY = {"file_only": True}
 
 # Global variables
 ROOT_LOGGER = None
+LISTENER: logging.handlers.QueueListener | None = None
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+_ROOT_INIT_LOCK = threading.Lock()
+# tags the root handler we install; hooks can load this module more than once, and each copy
+# would otherwise add its own handlers and write every record twice
+_HANDLER_SENTINEL = "_plainlicense_hooks"
+# the tagged handler also carries the listener, so every copy of this module can reach it
+_LISTENER_ATTR = "listener"
+
+
+def _ansi_wrap(**styles: str) -> tuple[str, str]:
+    """Returns the ANSI (open, close) codes click.style would wrap text in."""
+    opening, closing = click.style("\0", **styles).split("\0")  # type: ignore
+    return opening, closing
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    A Formatter that only rebuilds the `asctime` timestamp when the second changes.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Starts with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        self._time_cache: tuple[int, str] = (-1, "")
 
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        """Formats the record's time like logging.Formatter, reusing the last second's timestamp."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, timestamp = self._time_cache
+        if second != cached_second:
+            timestamp = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, timestamp)
+        return self.default_msec_format % (timestamp, record.msecs)
 
-class ColorFormatter(logging.Formatter):
+
+class ColorFormatter(CachedTimeFormatter):
     """Formats log messages."""
 
     COLORS: ClassVar[dict[str, str]] = {
@@ -51,6 +107,37 @@ class ColorFormatter(logging.Formatter):
         "CRITICAL": "bright_red",
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Builds the ANSI style table once so `format` only has to concatenate strings."""
+        super().__init__(*args, **kwargs)
+        self._level_prefix = {
+            level: click.style(f"{level:<8} ", fg=color) for level, color in self.COLORS.items()
+        }
+        self._msg_wrap = {level: _ansi_wrap(fg=color) for level, color in self.COLORS.items()}
+        self._msg_wrap_canary = {
+            level: _ansi_wrap(fg=color, bg="bright_blue") for level, color in self.COLORS.items()
+        }
+        self._default_wrap = _ansi_wrap(fg="white")
+        self._default_wrap_canary = _ansi_wrap(fg="white", bg="bright_blue")
+        # %-templates for record.name
+        self._module_prefix_normal = click.style("%-12s ", fg="bright_blue")
+        self._module_prefix_canary = click.style(
+            "%-12s ", fg="bright_yellow", bg="bright_blue", bold=True
+        )
+        # (levelname, logger name) -> (everything before the message, what closes it)
+        self._heads: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def _build_head(self, level: str, name: str) -> tuple[str, str]:
+        """Builds the styled level and logger name, and the message's ANSI codes."""
+        if name == "CANARY":
+            module_prefix = self._module_prefix_canary
+            msg_open, msg_close = self._msg_wrap_canary.get(level, self._default_wrap_canary)
+        else:
+            module_prefix = self._module_prefix_normal
+            msg_open, msg_close = self._msg_wrap.get(level, self._default_wrap)
+        level_prefix = self._level_prefix.get(level) or click.style(f"{level:<8} ", fg="white")
+        return level_prefix + module_prefix % name + msg_open, msg_close
+
     def format(self, record: logging.LogRecord) -> str:
         """The formatter...
 
@@ -62,97 +149,299 @@ class ColorFormatter(logging.Formatter):
 
         """
         try:
-            record.message = record.getMessage()
-            if record.message and len(record.message.splitlines()) > 1 and record.getMessage():
-                record.message = "\n" + pformat(record.getMessage(), indent=2, width=80)
-            if record.name == "CANARY":
-                module_color = {"fg": "bright_yellow", "bg": "bright_blue", "bold": True}
+            # str messages (including tracebacks the queue handler folded in) print as they are;
+            # only structured payloads get pretty-printed
+            if isinstance(record.msg, str):
+                msg = record.getMessage()
             else:
-                module_color = {"fg": "bright_blue"}
-            return (
-                click.style(
-                    f"{record.levelname:<8} ", fg=self.COLORS.get(record.levelname, "white")
-                )
-                + click.style(f"{record.name:<12} ", **module_color)  # type: ignore
-                + click.style(
-                    record.message or super().format(record),
-                    fg=(self.COLORS.get(record.levelname, "white")),
-                    bg="bright_blue" if record.name == "CANARY" else None,
-                )
-                + f" logger: {record.filename}"
-            )
+                msg = pformat(record.msg, indent=2, width=80)
+            record.message = "\n" + msg if "\n" in msg else msg
+            key = (record.levelname, record.name)
+            if (head := self._heads.get(key)) is None:
+                head = self._heads[key] = self._build_head(*key)
+            return "".join((
+                head[0],
+                record.message or super().format(record),
+                head[1],
+                "" if record.pathname == "(unknown file)" else f" logger: {record.filename}",
+            ))
         except TypeError:
             return super().format(record)
 
 
+class DedupFilter(logging.Filter):
+    """
+    Drops records that repeat the previous message within `window` seconds, and logs a single
+    "previous message repeated N times" record once the run of repeats ends.
+    """
+
+    def __init__(self, handler: logging.Handler, window: float = 30.0) -> None:
+        """Attaches to the handler the repeat summaries should go to."""
+        super().__init__()
+        self.handler = handler
+        self.window = window
+        self._lock = threading.RLock()
+        self._last_key: tuple[str, int, str] | None = None
+        self._last_record: logging.LogRecord | None = None
+        self._first_seen = 0.0
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Returns False for a repeat of the previous message."""
+        if getattr(record, "dedup_summary", False):
+            return True
+        try:
+            message = record.getMessage()
+        except Exception:  # filters must not raise; the handler reports the bad record
+            message = str(record.msg)
+        key = (record.name, record.levelno, message)
+        with self._lock:
+            if key == self._last_key and record.created - self._first_seen < self.window:
+                self._count += 1
+                return False
+            self.flush()
+            self._last_key, self._last_record = key, record
+            self._first_seen = record.created
+        return True
+
+    def flush(self) -> None:
+        """Logs how many times the previous message repeated, if it did."""
+        with self._lock:
+            if not (self._count and self._last_record):
+                return
+            summary = logging.makeLogRecord({
+                **self._last_record.__dict__,
+                "msg": "previous message repeated %d times",
+                "args": (self._count,),
+                "dedup_summary": True,
+            })
+            self._count = 0
+            self.handler.handle(summary)
+
+
+# log args of these types can't change after the call, so formatting them later gives the same message
+_IMMUTABLE_ARG_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that leaves message formatting to the listener thread when that's safe, so
+    logging from a hook costs little more than putting the record on the queue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Queues the record as-is unless it has mutable args, exception info, or a stack."""
+        if (
+            record.exc_info is None
+            and record.stack_info is None
+            and isinstance(record.args, tuple)
+            and all(type(arg) in _IMMUTABLE_ARG_TYPES for arg in record.args)
+        ):
+            return record
+        return super().prepare(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queues the record, first restarting the listener if a fork paused it."""
+        listener = getattr(self, _LISTENER_ATTR, None)
+        if listener is not None and listener.resume_pending:
+            listener.resume()
+        super().enqueue(record)
+
+
+class HookQueueListener(logging.handlers.QueueListener):
+    """
+    A QueueListener whose thread survives records that fail to format. Deferred records are
+    formatted on the listener thread, and QueueListener lets any error there end the thread,
+    which would silently drop every later record.
+
+    The thread is also stopped before a fork (some plugins use multiprocessing), so a child
+    can't inherit a lock the thread held mid-record, and it only restarts when the next record
+    is queued, so the process isn't multi-threaded while a plugin forks.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Sets up the listener and pauses its thread whenever the process forks."""
+        super().__init__(*args, **kwargs)
+        # held while the thread is stopped for a flush or a fork
+        self.pause_lock = threading.Lock()
+        self.resume_pending = False
+        os.register_at_fork(
+            before=self._pause_for_fork,
+            after_in_parent=self.pause_lock.release,
+            after_in_child=self.pause_lock.release,
+        )
+
+    def _pause_for_fork(self) -> None:
+        """Writes out what's queued and stops the thread before a fork."""
+        self.pause_lock.acquire()
+        if self._thread is not None:
+            self.stop()
+            self.flush_handlers()
+            self.resume_pending = True
+
+    def resume(self) -> None:
+        """Restarts the thread if a fork paused it."""
+        with self.pause_lock:
+            if self.resume_pending:
+                self.resume_pending = False
+                self.start()
+
+    def flush_handlers(self) -> None:
+        """Logs any pending "repeated N times" summaries and flushes the handlers' buffers."""
+        for handler in self.handlers:
+            for log_filter in handler.filters:
+                if isinstance(log_filter, DedupFilter):
+                    log_filter.flush()
+            handler.flush()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Offers the record to each handler, reporting errors like logging does in `emit`."""
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if self.respect_handler_level and record.levelno < handler.level:
+                continue
+            try:
+                handler.handle(record)
+            except Exception:
+                handler.handleError(record)
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    A StreamHandler that doesn't flush after every record, so its stream's buffer can batch writes.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Writes the record without flushing."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def stdout_handler() -> logging.StreamHandler:
+    """
+    Returns a handler for stdout. Terminals get the usual line-by-line output; otherwise (like in CI)
+    we write through a 64K buffer to cut the number of write() calls.
+    """
+    if sys.stdout.isatty():
+        return logging.StreamHandler(sys.stdout)
+    try:
+        stream = open(  # noqa: SIM115
+            sys.stdout.fileno(),
+            "w",
+            buffering=65536,
+            encoding=sys.stdout.encoding,
+            errors=sys.stdout.errors,
+            closefd=False,
+        )
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return logging.StreamHandler(sys.stdout)
+    return BufferedStreamHandler(stream)
+
+
+def _not_file_only(record: logging.LogRecord) -> bool:
+    """Keeps FILE_ONLY records off the console."""
+    return not getattr(record, "file_only", False)
+
+
 def configure_handler(
     handler: logging.Handler, fmt: logging.Formatter, level: int
 ) -> logging.Handler:
     """Configures a handler with the specified format and level."""
     handler.setFormatter(fmt)
-    if isinstance(handler, logging.FileHandler):
-        level = min(level, logging.INFO)
     handler.setLevel(level)
     return handler
 
 
 def configure_root_logger() -> logging.Logger:
     """Configures the root logger with predefined settings."""
-
-    def set_override() -> int:
-        """Set the override level."""
-        return LOG_LEVEL_OVERRIDE
-
+    global LISTENER
     root_logger = logging.getLogger()
-    log_level = logging.NOTSET
+    if any(getattr(handler, _HANDLER_SENTINEL, False) for handler in root_logger.handlers):
+        LISTENER = get_listener()
+        return root_logger
+    handlers: list[logging.Handler] = []
     if FILEHANDLER_ENABLED:
-        file_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        if LOG_LEVEL_OVERRIDE < logging.INFO:
-            log_level = set_override()
-        root_logger.addHandler(
-            configure_handler(logging.FileHandler(LOG_SAVE_PATH), file_format, log_level)
+        file_format = CachedTimeFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        file_handler = configure_handler(
+            logging.FileHandler(LOG_SAVE_PATH), file_format, _FILE_LEVEL
         )
+        # buffer file records so we write in batches instead of once per record;
+        # errors flush right away, and logging.shutdown flushes the rest at exit
+        file_buffer = logging.handlers.MemoryHandler(
+            1024, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+        )
+        file_buffer.setLevel(file_handler.level)
+        file_buffer.addFilter(DedupFilter(file_buffer))
+        handlers.append(file_buffer)
     if STREAMHANDLER_ENABLED:
         formatter = ColorFormatter("%(asctime)s - %(message)s")
-        if LOG_LEVEL_OVERRIDE < logging.INFO:
-            log_level = set_override()
-        root_logger.addHandler(
-            configure_handler(logging.StreamHandler(sys.stdout), formatter, log_level)
-        )
+        stream_handler = configure_handler(stdout_handler(), formatter, _HANDLER_LEVEL)
+        stream_handler.addFilter(_not_file_only)
+        stream_handler.addFilter(DedupFilter(stream_handler))
+        handlers.append(stream_handler)
+    if handlers:
+        # hooks only put records on the queue; a background thread does the formatting and I/O
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        LISTENER = HookQueueListener(log_queue, *handlers, respect_handler_level=True)
+        LISTENER.start()
+        # registered after logging's own atexit hook, so it runs first and drains the queue
+        atexit.register(flush_logs, restart=False)
+        queue_handler = DeferredQueueHandler(log_queue)
+        setattr(queue_handler, _HANDLER_SENTINEL, True)
+        setattr(queue_handler, _LISTENER_ATTR, LISTENER)
+        root_logger.addHandler(queue_handler)
     return root_logger
 
 
+def get_listener() -> HookQueueListener | None:
+    """
+    Returns the QueueListener behind our root handler, whichever copy of this module started it.
+    mkdocs loads hooks under their file path, so the hook copy of this module usually finds the
+    handlers already installed by the copy the other hooks imported.
+    """
+    for handler in logging.getLogger().handlers:
+        if getattr(handler, _HANDLER_SENTINEL, False):
+            return getattr(handler, _LISTENER_ATTR, None)
+    return None
+
+
+def flush_logs(*, restart: bool = True) -> None:
+    """
+    Writes out everything logged so far. The listener formats and writes records on its own
+    thread, so we stop it first (which drains the queue), log any pending "repeated N times"
+    summaries, flush its handlers' buffers, and then start it again unless we're exiting.
+    """
+    if (listener := get_listener()) is None:
+        return
+    with listener.pause_lock:
+        listener.stop()
+        listener.resume_pending = False
+        try:
+            listener.flush_handlers()
+        finally:
+            if restart:
+                listener.start()
+
+
 def get_logger(name: str, level: int = logging.WARNING) -> logging.Logger:
     """
     Get a logger instance with the specified name and logging level.
     """
     global ROOT_LOGGER
-    ROOT_LOGGER = ROOT_LOGGER or configure_root_logger()
-    if child := next(
-        (child for child in ROOT_LOGGER.getChildren() if child and child.name == name), None
-    ):
-        if bland_handler := next(
-            (
-                handler
-                for handler in child.handlers
-                if child.handlers
-                and isinstance(handler, logging.StreamHandler)
-                and (not handler.formatter or not isinstance(handler.formatter, ColorFormatter))
-            ),
-            None,
-        ):
-            child.removeHandler(bland_handler)
-            child.addHandler(
-                configure_handler(
-                    logging.StreamHandler(sys.stdout),
-                    ColorFormatter("%(asctime)s - %(message)s"),
-                    level,
-                )
-            )
-        return child
+    if (cached := _LOGGER_CACHE.get(name)) is not None:
+        return cached
+    if ROOT_LOGGER is None:
+        with _ROOT_INIT_LOCK:
+            if ROOT_LOGGER is None:
+                ROOT_LOGGER = configure_root_logger()
     logger = ROOT_LOGGER.getChild(name)
     logger.setLevel(min(level, LOG_LEVEL_OVERRIDE))
     logger.propagate = True
+    _LOGGER_CACHE[name] = logger
     return logger
 
 
@@ -160,7 +449,13 @@ def get_logger(name: str, level: int = logging.WARNING) -> logging.Logger:
 @event_priority(100)
 def on_startup(command: MkDocsCommand, dirty: bool) -> None:  # noqa: FBT001
     """Log startup."""
-    Status(command)
+    get_status(command)
     logging.captureWarnings(True)
     logger = get_logger("MkDocs", logging.DEBUG)
     logger.info("Starting %s command", command)
+
+
+@event_priority(-100)
+def on_post_build(config: MkDocsConfig) -> None:
+    """Flush buffered logs so each build's logs are written out (mkdocs serve rebuilds without exiting)."""
+    flush_logs()
@@ -15,34 +15,74 @@ import json
 import logging
 import re
 
-from copy import copy
 from datetime import UTC, datetime
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 from re import Match, Pattern
 from textwrap import dedent, indent
 from typing import Any, ClassVar, Literal
 
-import ez_yaml
+import yaml
 
-from _utils import Status, find_repo_root, wrap_text
+from _utils import find_repo_root, get_status, wrap_text
 from hook_logger import get_logger
-from jinja2 import Template, TemplateError
+from jinja2 import Environment, Template, TemplateError
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.structure.files import File, Files, InclusionLevel
 from mkdocs.structure.pages import Page
 
 
+try:
+    import orjson
+except ImportError:  # orjson is a dev dependency; fall back to the stdlib
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YAMLDumper
+    from yaml import SafeLoader as YAMLLoader
+
+
 # Change logging level here
 _assembly_log_level = logging.WARNING
 
 if not hasattr(__name__, "assembly_logger"):
     assembly_logger = get_logger("ASSEMBLER", _assembly_log_level)
 
+# same defaults as a bare `Template(...)`, but shared, so we can reuse compiled templates;
+# we render markdown, not html, so no autoescaping
+_JINJA_ENV = Environment(auto_reload=False, cache_size=-1)  # noqa: S701
+
+
+# the copyright year for the whole build
+_BUILD_YEAR = datetime.now(UTC).strftime("%Y")
+
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str) -> Template:
+    """
+    Compiles a template string once. Most boilerplate values are the same on every license page,
+    so after the first page they're cache hits.
+    """
+    return _JINJA_ENV.from_string(source)
+
+
+def render_template(source: str, context: dict[str, Any]) -> str:
+    """
+    Renders a template string with a context. Text without any jinja syntax skips jinja
+    entirely; we only mimic jinja dropping a single trailing newline.
+    """
+    if "{" not in source and "\r" not in source:
+        return source.removesuffix("\n")
+    return compile_template(source).render(**context)
+
 
 def clean_content(content: dict[str, Any]) -> dict[str, Any] | None:
     """
-    Strips whitespace from string values in a dictionary, and from strings in lists.
+    Strips whitespace from string values in a dictionary, and from strings in lists. None values
+    become empty strings; other falsy values (False, 0, empty lists) are kept as they are.
 
     Args:
         content (Any): The dictionary to clean.
@@ -53,34 +93,81 @@ def clean_content(content: dict[str, Any]) -> dict[str, Any] | None:
     Examples:
         cleaned_content = clean_content({"title": "  Example Title  ", "tags": ["  tag1  ", "tag2 "]})
     """
+    return {k: "" if v is None else _strip_strings(v) for k, v in content.items()}
+
 
-    def cleaner(value: Any) -> Any:
-        """Strips whitespace from a string."""
-        if isinstance(value, dict):
-            return {k: cleaner(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [cleaner(item) for item in value]
-        return value.strip() if isinstance(value, str) else value
+def _strip_strings(value: Any) -> Any:
+    """
+    Strips whitespace from a string, or from the strings nested in a dict or list.
 
-    return {k: cleaner(v) if v else "" for k, v in content.items()}
+    Plain dicts and lists are only copied if something in them changes; other mappings and
+    sequences (like ruamel's commented types) always come back as plain dicts and lists.
+    """
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        new_dict = None if type(value) is dict else dict(value)
+        for key, item in value.items():
+            if (cleaned := _strip_strings(item)) is not item:
+                if new_dict is None:
+                    new_dict = dict(value)
+                new_dict[key] = cleaned
+        return value if new_dict is None else new_dict
+    if isinstance(value, list):
+        new_list = None if type(value) is list else list(value)
+        for index, item in enumerate(value):
+            if (cleaned := _strip_strings(item)) is not item:
+                if new_list is None:
+                    new_list = list(value)
+                new_list[index] = cleaned
+        return value if new_list is None else new_list
+    return value
+
+
+_CHOOSE_A_LICENSE_DIR = "external/choosealicense.com/_licenses"
+_SPDX_DETAILS_DIR = "external/license-list-data/json/details"
+
+
+@cache
+def _license_file_index(directory: str, pattern: str) -> dict[str, Path]:
+    """
+    Maps the lowercased stems of the files in directory to their paths. The external license
+    data doesn't change during a build, so we only glob each directory once.
+    """
+    return {path.stem.lower(): path for path in Path(directory).glob(pattern)}
 
 
 def get_extra_meta(spdx_id: str) -> dict[str, Any]:
     """Returns the extra metadata for the license."""
-    choose_a_license_files = list(Path("external/choosealicense.com/_licenses").glob("*.txt"))
+    return dict(_get_extra_meta(spdx_id.lower()))
+
+
+def get_frontmatter_text(text: str) -> str | None:
+    """
+    Returns the raw frontmatter between the opening and closing `---` lines, or None if the
+    text doesn't start with frontmatter.
+    """
+    if not text.startswith("---\n") or (end := text.find("\n---", 4)) == -1:
+        return None
+    return text[4:end]
+
+
+@cache
+def _get_extra_meta(spdx_id: str) -> dict[str, Any]:
+    """Builds the extra metadata for a (lowercased) SPDX ID. `get_extra_meta` returns copies."""
     new_meta = {}
-    if file := next((f for f in choose_a_license_files if f.stem.lower() == spdx_id.lower()), None):
+    if file := _license_file_index(_CHOOSE_A_LICENSE_DIR, "*.txt").get(spdx_id):
         raw_text = file.read_text()
-        if match := re.search(r"---\n(.*?)\n---", raw_text, re.DOTALL):
-            frontmatter = ez_yaml.to_object(match[1])
+        if frontmatter_text := get_frontmatter_text(raw_text):
+            frontmatter = yaml.load(frontmatter_text, Loader=YAMLLoader)
             if isinstance(frontmatter, dict) and (
                 cleaned_frontmatter := clean_content(frontmatter)
             ):
-                new_meta |= {
+                new_meta = {
                     f"cal_{k}": v for k, v in cleaned_frontmatter.items() if v and k != "using"
-                } | cleaned_frontmatter.get("using", {})
-    spdx_files = list(Path("external/license-list-data/json/details").glob("*.json"))
-    if file := next((f for f in spdx_files if (f.stem.lower() == spdx_id.lower())), None):
+                }
+                new_meta |= cleaned_frontmatter.get("using") or {}
+    if file := _license_file_index(_SPDX_DETAILS_DIR, "*.json").get(spdx_id):
         assembly_logger.debug("Found SPDX file: %s", file)
         if cleaned_spdx := clean_content(load_json(file)):
             new_meta |= cleaned_spdx
@@ -94,7 +181,7 @@ def render_mapping(mapping: dict[str, Any], context: dict) -> dict[str, Any]:
         """Recursively render a value."""
         if isinstance(value, str):
             try:
-                return Template(value).render(**context)
+                return render_template(value, context)
             except (TypeError, TemplateError):
                 assembly_logger.exception("Error rendering mapping")
                 return value
@@ -108,30 +195,43 @@ def render_mapping(mapping: dict[str, Any], context: dict) -> dict[str, Any]:
     return {key: render_value(value) for key, value in mapping.items()}
 
 
+_boilerplate_cache: tuple[dict[str, Any], dict[str, Any]] | None = None
+
+
+def get_boilerplate(config: MkDocsConfig) -> dict[str, Any]:
+    """
+    Returns the cleaned boilerplate from the config. It's the same for every license, so we
+    only clean it once per config.
+    """
+    global _boilerplate_cache
+    boilerplate: dict[str, Any] = config["extra"]["boilerplate"]
+    if _boilerplate_cache and _boilerplate_cache[0] is boilerplate:
+        return _boilerplate_cache[1]
+    boilerplate["year"] = boilerplate.get("year", _BUILD_YEAR).strip()
+    cleaned = clean_content(boilerplate) or {}
+    _boilerplate_cache = (boilerplate, cleaned)
+    return cleaned
+
+
 def assemble_license_page(config: MkDocsConfig, page: Page, file: File) -> Page:
     """Returns the rendered boilerplate from the config."""
     if not page.meta:
         assembly_logger.error("No metadata found for %s", page.title)
         return page
-    meta = dict(page.meta)
-    meta = clean_content(meta)
+    meta = clean_content(page.meta) or {}  # clean_content already returns a new dict
 
-    boilerplate: dict[str, str] = config["extra"]["boilerplate"]
-    boilerplate["year"] = boilerplate.get("year", datetime.now(UTC).strftime("%Y")).strip()
-    boilerplate = clean_content(boilerplate) or {}
-    page.meta = meta | boilerplate  # type: ignore
+    boilerplate = get_boilerplate(config)
+    page.meta = meta | boilerplate
     p_license = LicenseContent(page)
     if meta:
+        # merged in place; the cached extra metadata is only read, so we skip get_extra_meta's copy
         meta |= p_license.attributes
-        extra_meta = get_extra_meta(page.meta["spdx_id"])
-        meta |= extra_meta
+        meta |= _get_extra_meta(page.meta["spdx_id"].lower())
     assembly_logger.debug("Rendering boilerplate for %s", page.title)
-    if meta is None:
-        meta = {}
-    rendered_boilerplate = render_mapping(boilerplate, meta)
-    meta |= rendered_boilerplate
+    meta |= render_mapping(boilerplate, meta)
     markdown = (page.markdown or "") + p_license.license_content
-    markdown = Template(markdown).render(**meta)
+    # each page's markdown is unique, so compile it without going through compile_template's cache
+    markdown = _JINJA_ENV.from_string(markdown).render(**meta)
     page.meta = meta
     page.markdown = markdown
     return page
@@ -139,12 +239,11 @@ def assemble_license_page(config: MkDocsConfig, page: Page, file: File) -> Page:
 
 def create_page_content(page: Page) -> str:
     """Creates the content for a license page."""
-    frontmatter = ez_yaml.to_string(page.meta)
-    if not frontmatter.startswith("---"):
-        frontmatter = "---\n" + frontmatter
-    if not frontmatter.endswith("---"):
-        frontmatter += "\n---\n"
-    return f"{frontmatter}{page.markdown or ''}"
+    frontmatter = yaml.dump(
+        page.meta, Dumper=YAMLDumper, sort_keys=False, allow_unicode=True, default_flow_style=False
+    )
+    # yaml.dump never writes document markers here (no explicit_start/end)
+    return f"---\n{frontmatter}\n---\n{page.markdown or ''}"
 
 
 def create_new_file(page: Page, file: File, config: MkDocsConfig) -> File:
@@ -157,32 +256,38 @@ def create_new_file(page: Page, file: File, config: MkDocsConfig) -> File:
     return new_file
 
 
+_CATEGORIES = frozenset({
+    "proprietary",
+    "public-domain",
+    "copyleft",
+    "permissive",
+    "source-available",
+})
+
+
 def get_category(uri: str) -> str | None:
     """Returns the category of the license."""
-    if (
-        (split := uri.split("/"))
-        and len(split) == 4
-        and split[1]
-        in ["proprietary", "public-domain", "copyleft", "permissive", "source-available"]
-    ):
-        return split[1]
-    return None
+    if uri.count("/") != 3:  # licenses are always at licenses/<category>/<license>/index.md
+        return None
+    category = uri.split("/", 2)[1]
+    return category if category in _CATEGORIES else None
 
 
 def filter_license_files(files: Files) -> Files:
     """Creates a new files object from the license files."""
     license_files = [
-        files.src_uris[uri]
-        for uri in files.src_uris
-        if (files.src_uris[uri] and get_category(uri) and uri.strip().lower().endswith("index.md"))
+        file
+        for uri, file in files.src_uris.items()
+        if file and uri.lower().endswith("index.md") and get_category(uri)
     ]
     return Files(license_files)
 
 
 def replace_files(files: Files, new_files: Files) -> Files:
     """Replaces files in the files object."""
+    src_uris = files.src_uris
     for file in new_files:
-        if replaced_file := files.get_file_from_path(file.src_uri):
+        if replaced_file := src_uris.get(file.src_uri):
             files.remove(replaced_file)
         files.append(file)
     return files
@@ -217,7 +322,7 @@ def on_files(files: Files, config: MkDocsConfig) -> Files:
     Raises:
         Exception: If there is an error during template rendering or logging.
     """
-    license_files = filter_license_files(copy(files))
+    license_files = filter_license_files(files)
     if not license_files:
         assembly_logger.error("No license files found. Files: %s", files)
         raise FileNotFoundError("No license files found.")  # noqa: TRY003
@@ -235,16 +340,152 @@ def on_files(files: Files, config: MkDocsConfig) -> Files:
     return replace_files(files, Files(new_license_files))
 
 
+_json_cache: dict[Path, tuple[int, dict[str, Any]]] = {}
+
+
 def load_json(path: Path) -> dict[str, Any]:
-    """Loads a JSON."""
-    return json.loads(path.read_text())
+    """
+    Loads a JSON. Parsed files are cached until they change on disk, so `mkdocs serve` rebuilds
+    don't re-parse them. Write changes back with `write_json`.
+    """
+    mtime = path.stat().st_mtime_ns
+    if (cached := _json_cache.get(path)) and cached[0] == mtime:
+        return cached[1]
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    _json_cache[path] = (mtime, data)
+    return data
 
 
 def write_json(path: Path, data: dict[str, Any]) -> None:
     """Writes a JSON."""
-    if path.exists():
-        path.unlink()
-    path.write_text(json.dumps(data, indent=2))
+    _json_cache.pop(path, None)
+    if orjson:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
+
+# blocks api options shared by the license admonitions; blockify only reads them
+_LICENSE_BLOCK_OPTIONS: dict[str, str | dict[str, str]] = {"type": "license"}
+
+
+# disclaimers for license pages, dedented once and filled in per license
+_NOT_ADVICE_TEXT = dedent("""\
+    We are not lawyers. This is not legal advice. If you need legal advice, talk to a lawyer. You use this license at your own risk.
+
+    We are normal people who want to make licenses accessible for everyone. We hope that our plain language helps you and anyone else understand this license  (including lawyers). If you see a mistake or want to suggest a change, please [submit an issue on GitHub]({issues_link} "Submit an issue on GitHub") or [edit this page]({edit_link} "edit on GitHub").
+    """)
+
+
+_NOT_OFFICIAL_TEXT = dedent("""\
+    Plain License is not affiliated with the original {original_name} authors or {original_organization}. **Our plain language versions are not official** and are not endorsed by the original authors. Our licenses may also include different terms or additional information. We try to capture the *legal meaning* of the original license, but we can't guarantee our license provides the same legal protections.
+
+    If you want to use the {plain_name}, start by reading the official {original_name} license text. You can find the official {original_name} [here]({original_url} "check out the official {original_name}"). If you have questions about the {original_name}, you should talk to a lawyer.
+    """)
+
+
+# the iframe snippet for embedding a license
+_EMBED_LINK = dedent("""
+    # Embedding Your License
+
+    ```html title="add this to your site's html"
+
+    <iframe src="{embed_url}"
+    style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;
+    border: 1px solid #E4C580; border-radius: 8px; overflow: hidden auto;"
+    title="{title}" loading="lazy" sandbox="allow-scripts"
+    onload="if(this.contentDocument.body.scrollHeight > 400)
+    this.style.height = this.contentDocument.body.scrollHeight + 'px';"
+    referrerpolicy="no-referrer-when-downgrade">
+        <p>Your browser does not support iframes. View {title} at:
+            <a href="{url}">
+                plainlicense.org
+            </a>
+        </p>
+    </iframe>
+
+    ```
+""").strip()
+
+
+# embed instructions for license pages, split around the two embed URL slots so each license
+# only has to join the pieces
+_EMBED_INSTRUCTIONS_PARTS = dedent("""
+
+    The above code will embed the license in your site. It uses an iframe to display the license as it appears on Plain License. This also sandboxes the license to prevent it from affecting your site.
+
+    1. **Copy the code above** using the copy button
+    2. **Paste it** into your HTML where you want the license to appear
+    3. **Adjust the size** (optional):
+
+       - The default width is 100% (fills the container)
+       - The default height is either the content height or 1024px, whichever is smaller.
+       - The next section provides more details on customizing the size.
+
+    ## Customizing Your Embedded License
+
+    ### Changing the Size
+
+    Common size adjustments in the `style` attribute:
+
+    ```html
+
+    <!-- Full width, taller -->
+    style="width: 100%; height: 800px;"
+
+    <!-- Fixed width, default height -->
+    style="width: 800px; height: 500px;"
+
+    <!-- Full width, minimum height -->
+    style="width: 100%; min-height: 500px;"
+
+    ```
+
+    ## Color Scheme Preference
+
+    The embedded license will match your visitors' system preferences for light or dark mode by default.
+
+    ### Forcing a Specific Theme
+
+    To force a specific theme, add `?theme=` to the URL, along with `light` or `dark`:
+
+    - For light theme: `src="{embed_url}?theme=light"`
+    - For dark theme: `src="{embed_url}?theme=dark"`
+
+    ### Syncing the License Theme with Your Site (more advanced)
+
+    You can optionally sync the license's light/dark theme to your site's theme. You will need to send the embedded license page a message to tell it what theme your site is currently using. You can include this code in your script bundle or HTML:
+
+    ```javascript title="sync the light/dark theme with your site"
+
+    const syncTheme = () => {
+    const iframe = document.getElementById("license-embed");
+    const theme = document.documentElement.classList.contains("dark") ? "dark" : "light";
+    iframe.contentWindow.postMessage({ theme }, "https://plainlicense.org");
+    };
+
+    ```
+
+    If your site has a toggle switch for changing themes, you can link it to the embedded license. Set up the toggle to send a `themeChange` event and add a listener to dispatch the same message. We can't provide specific code for that because it depends on your setup.
+
+    Once your toggle switch is set up to send a `themeChange` event, you need to add a listener to dispatch the same message as before:
+
+    ```javascript title="toggle license theme with site theme"
+
+    const syncTheme = () => {
+    const iframe = document.getElementById("license-embed");
+    const theme = document.documentElement.classList.contains("dark") ? "dark" : "light";
+    iframe.contentWindow.postMessage({ theme }, "https://plainlicense.org");
+    };
+    document.addEventListener('themeChange', syncTheme);
+
+    ```
+
+    ## Need Help?
+
+    Bring your questions to our [GitHub Discussions](https://github.com/seekinginfiniteloop/PlainLicense/discussions "visit Plain License's discussions page") for help and support.
+    """).split("{embed_url}")
 
 
 class LicenseContent:
@@ -259,7 +500,7 @@ class LicenseContent:
     _code_pattern: ClassVar[Pattern[str]] = re.compile(
         r"(`{3}markdown|`{3}plaintext(.*?)`{3})", re.DOTALL
     )
-    _definition_pattern = re.compile(
+    _definition_pattern: ClassVar[Pattern[str]] = re.compile(
         r"(?P<term>`[\w\s]+`)\s*?\n{1,2}[:]\s{1,4}(?P<def>[\w\s]+)\n{2}", re.MULTILINE
     )
     _annotation_pattern: ClassVar[Pattern[str]] = re.compile(
@@ -271,8 +512,37 @@ class LicenseContent:
     )
     _header_pattern: ClassVar[Pattern[str]] = re.compile(r"#+ (\w+?)\n")
     _markdown_pattern: ClassVar[Pattern[str]] = re.compile(r"#+ |(\*\*|\*|`)(.*?)\1", re.MULTILINE)
-    _link_pattern: ClassVar[Pattern[str]] = re.compile(r"\[(.*?)\]\((.*?)\)", re.MULTILINE)
-    _image_pattern: ClassVar[Pattern[str]] = re.compile(r"!\[(.*?)\]\((.*?)\)", re.MULTILINE)
+    # links and images
+    _link_pattern: ClassVar[Pattern[str]] = re.compile(r"!?\[(.*?)\]\((.*?)\)", re.MULTILINE)
+    _attribute_pattern: ClassVar[Pattern[str]] = re.compile(r"\{\s?\.\w+\s?\}")
+    _plain_name_pattern: ClassVar[Pattern[str]] = re.compile(
+        r"\{\{\s{1,2}plain_name\s\|\strim\s{1,2}\}\}"
+    )
+
+    # maps frontmatter conditions, permissions, and limitations to tags
+    tag_map: ClassVar[dict[str, str]] = {
+        "distribution": "can-share",  # allowances
+        "commercial-use": "can-sell",
+        "modifications": "can-change",
+        "revokable": "can-revoke",
+        "relicense": "relicense",
+        "disclose-source": "share-source",  # requirements
+        "document-changes": "describe-changes",
+        "include-copyright": "give-credit",
+        "same-license": "share-alike (strict)",
+        "same-license--file": "share-alike (relaxed)",
+        "same-license--library": "share-alike (relaxed)",
+    }
+
+    # license tab icons
+    icon_map: ClassVar[dict[str, str]] = {
+        "reader": ":material-book-open-variant:",
+        "markdown": ":octicons-markdown-24:",
+        "plaintext": ":nounproject-txt:",
+        "embed": ":material-language-html5:",
+        "changelog": ":material-history:",
+        "official": ":material-license:",
+    }
 
     def __init__(self, page: Page) -> None:
         """
@@ -290,10 +560,8 @@ class LicenseContent:
         self.meta = page.meta
         self.license_type = self.get_license_type()
         self.title = f"The {self.meta['plain_name']}"
-        self.year = str(datetime.now(UTC).strftime("%Y"))
-        self.reader_license_text: str = self.replace_year(self.meta["reader_license_text"])
-        self.markdown_license_text = self.process_mkdocs_to_markdown()
-        self.plaintext_license_text = self.process_markdown_to_plaintext()
+        self.title_html = f"<span class='detail-title-highlight'>{self.title}</span>"
+        self.year = _BUILD_YEAR
         self.changelog_text = self.meta.get(
             "changelog", "\n## such empty, much void :nounproject-doge:"
         )
@@ -305,7 +573,23 @@ class LicenseContent:
 
         self.embed_url = f"https://plainlicense.org/embed/{self.meta['spdx_id'].lower()}.html"
 
-        assembly_logger.debug("License content: \n\n%s\n", self.license_content)
+        if assembly_logger.isEnabledFor(logging.DEBUG):
+            assembly_logger.debug("License content: \n\n%s\n", self.license_content)
+
+    @cached_property
+    def reader_license_text(self) -> str:
+        """Returns the reader license text with the year filled in."""
+        return self.replace_year(self.meta["reader_license_text"])
+
+    @cached_property
+    def markdown_license_text(self) -> str:
+        """Returns the license text as standard markdown."""
+        return self.process_mkdocs_to_markdown()
+
+    @cached_property
+    def plaintext_license_text(self) -> str:
+        """Returns the license text as plaintext."""
+        return self.process_markdown_to_plaintext()
 
     def get_license_type(self) -> Literal["dedication", "license"]:
         """
@@ -338,14 +622,13 @@ class LicenseContent:
         """
         text = text or self.markdown_license_text
         text = self.process_definitions(text, plaintext=True)
-        if headers := self._header_pattern.finditer(text):
-            for header in headers:
-                text = text.replace(header.group(0), f"{header.group(1).upper()}\n")
+        text = type(self)._header_pattern.sub(  # noqa: SLF001
+            lambda header: f"{header.group(1).upper()}\n", text
+        )
         text = type(self)._markdown_pattern.sub(  # noqa: SLF001
             r"\2", text
         )  # Remove headers, bold, italic, inline code
-        text = type(self)._link_pattern.sub(r"\1 (\2)", text)  # Handle links  # noqa: SLF001
-        text = type(self)._image_pattern.sub(r"\1 (\2)", text)  # Handle images  # noqa: SLF001
+        text = type(self)._link_pattern.sub(r"\1 (\2)", text)  # Handle links and images  # noqa: SLF001
         return type(self)._code_pattern.sub(r"===\1===", text)  # Remove code blocks  # noqa: SLF001
 
     @staticmethod
@@ -362,20 +645,16 @@ class LicenseContent:
         Returns:
             str: The processed text with definitions formatted appropriately.
         """
-        definition_pattern = LicenseContent._definition_pattern
-        if matches := definition_pattern.finditer(text):
-            for match in matches:
-                term = match.group("term")
-                def_text = match.group("def")
-                if plaintext:
-                    replacement = "\n" + dedent(f"""{term.replace("`", "")} - {def_text}""") + "\n"
-                else:
-                    replacement = "\n" + dedent(f"""{term}:\n{def_text}""") + "\n"
-                text = text.replace(match.group(0), replacement)
-        if matches := re.findall(r"\{\s?\.\w+\s?\}", text):
-            for match in matches:
-                text = text.replace(match, "")
-        return text
+
+        def replacement(match: Match[str]) -> str:
+            """Formats a single definition match."""
+            term, def_text = match.group("term", "def")
+            if plaintext:
+                return "\n" + dedent(f"""{term.replace("`", "")} - {def_text}""") + "\n"
+            return "\n" + dedent(f"""{term}:\n{def_text}""") + "\n"
+
+        text = LicenseContent._definition_pattern.sub(replacement, text)
+        return LicenseContent._attribute_pattern.sub("", text)
 
     def get_plain_version(self) -> str:
         """
@@ -386,8 +665,9 @@ class LicenseContent:
         """
         spdx_id = self.meta["spdx_id"].lower()
         package_path = find_repo_root() / "packages" / spdx_id / "package.json"
-        assembly_logger.debug("Checking package path: %s", package_path)
-        assembly_logger.debug("package_path.exists(): %s", package_path.exists())
+        if assembly_logger.isEnabledFor(logging.DEBUG):
+            assembly_logger.debug("Checking package path: %s", package_path)
+            assembly_logger.debug("package_path.exists(): %s", package_path.exists())
         if not package_path.exists():
             return "0.0.0"
         if package_path.exists():
@@ -395,7 +675,7 @@ class LicenseContent:
             version = package.get("version")
             if not version:
                 return "0.0.0"
-            if "development" in version and Status.production:
+            if "development" in version and (status := get_status()) and status.production:
                 package["version"] = "0.1.0"
                 write_json(package_path, package)
                 return "0.1.0"
@@ -429,12 +709,12 @@ class LicenseContent:
             footnotes.append(match.group("annotation").strip())
             return f"[^{footnote_num}]"
 
-        transformed_text = type(self)._annotation_pattern.sub(replacement, text)  # noqa: SLF001
+        parts = [type(self)._annotation_pattern.sub(replacement, text)]  # noqa: SLF001
         if footnotes:
-            transformed_text += "\n\n"
-            for i, footnote in enumerate(footnotes, 1):
-                transformed_text += f"[^{i}]: {footnote}\n\n"
-        return transformed_text + "\n\n"
+            parts.append("\n\n")
+            parts.extend(f"[^{i}]: {footnote}\n\n" for i, footnote in enumerate(footnotes, 1))
+        parts.append("\n\n")
+        return "".join(parts)
 
     def replace_year(self, text: str) -> str:
         """
@@ -446,6 +726,8 @@ class LicenseContent:
         Returns:
             str: The text with the year placeholder replaced by the current year.
         """
+        if "year" not in text:
+            return text
         return type(self)._year_pattern.sub(self.year, text)  # noqa: SLF001
 
     def replace_code_blocks(self, text: str) -> str:
@@ -499,18 +781,21 @@ class LicenseContent:
         Returns:
             list[str] | None: A list of mapped tags if found, or None if no valid tags are present.
         """
-        possible_tags: list[list[str | None] | None] = [
+        possible_tags: tuple[list[str | None] | None, ...] = (
             self.meta.get("conditions"),
             self.meta.get("permissions"),
             self.meta.get("limitations"),
+        )
+        if not any(possible_tags):
+            return None
+        tag_map = LicenseContent.tag_map
+        return [
+            tag_map[tag]
+            for taglist in possible_tags
+            if taglist
+            for tag in taglist
+            if tag in tag_map
         ]
-        frontmatter_tags = []
-        for taglist in possible_tags:
-            if taglist:
-                frontmatter_tags.extend(taglist)
-        if frontmatter_tags:
-            return [self.tag_map[tag] for tag in frontmatter_tags if tag in self.tag_map]
-        return None
 
     @staticmethod
     def tabify(text: str, title: str, level: int = 1, icon: str = "") -> str:
@@ -526,8 +811,8 @@ class LicenseContent:
         Returns:
             str: The tabified block with the provided text.
         """
-        indentation = " " * 4 * level
-        title_indent = "" if level == 1 else " " + " " * 4 * (level - 1)
+        indentation = " " * (4 * level)
+        title_indent = "" if level == 1 else " " * (4 * level - 3)
         icon = f"{icon} " if icon else ""
         title = f"""{title_indent}=== "{icon}{title}" """
         return f"""{title}\n\n{indent(dedent(text), indentation)}\n"""
@@ -551,16 +836,15 @@ class LicenseContent:
         ///
         """
         separator = "/" * separator_count
-        option_block = ""
-
-        if options:
-            for k, v in options.items():
-                if isinstance(v, dict):
-                    dict_block = "{ " + ", ".join([f"{kk}: {vv}" for kk, vv in v.items()]) + " }"
-                    option_block += f"{' ' * (separator_count + 1)} {k}: {dict_block}\n"
-                elif v:
-                    option_block += f"{' ' * (separator_count + 1)}{k}: {v}\n"
-
+        indentation = " " * (separator_count + 1)
+        option_lines = []
+        for k, v in (options or {}).items():
+            if isinstance(v, dict):
+                dict_block = "{ " + ", ".join(f"{kk}: {vv}" for kk, vv in v.items()) + " }"
+                option_lines.append(f"{indentation} {k}: {dict_block}\n")
+            elif v:
+                option_lines.append(f"{indentation}{k}: {v}\n")
+        option_block = "".join(option_lines)
         return f"""\n{separator} {kind} | {title}\n{option_block}\n{text}\n{separator}\n"""
 
     def interpretation_block(self, kind: str) -> str:
@@ -584,10 +868,8 @@ class LicenseContent:
                     self.meta.get("interpretation_text", "")
                 )
                 title = self.meta.get("interpretation_title", "")
-                title = re.sub(
-                    r"\{\{\s{1,2}plain_name\s\|\strim\s{1,2}\}\}",
-                    self.meta.get("plain_name", "").upper(),
-                    title,
+                title = type(self)._plain_name_pattern.sub(  # noqa: SLF001
+                    self.meta["plain_name"].upper(), title
                 )
                 return f"{title.upper()}\n\n{dedent(as_plaintext)}"
         return ""
@@ -611,13 +893,13 @@ class LicenseContent:
                 version_info = f"""<div class='version-info'>{original_version_html}{plain_version_html}</div>"""
                 return f"""<div class="license-header">{title}{version_info}</div>"""
             case "markdown":
-                title = f"\n# {self.meta.get('plain_name')}"
+                title = f"\n# {self.meta['plain_name']}"
                 original_text = (
                     f"original version: {original_version}  |  " if original_version else ""
                 )
                 return f"> {original_text}plain version: {plain_version}\n{title}"
             case _:
-                title = f"\n{self.meta.get('plain_name', '').upper()}"
+                title = f"\n{self.meta['plain_name'].upper()}"
                 original_text = (
                     f"original version: {original_version}  |  " if original_version else ""
                 )
@@ -651,56 +933,27 @@ class LicenseContent:
             "embed_file_markdown": self.embed_file_markdown,
         }
 
-    @cached_property
-    def tag_map(self) -> dict[str, str]:
-        """Returns the tag map for the license for setting tags."""
-        return {
-            "distribution": "can-share",  # allowances
-            "commercial-use": "can-sell",
-            "modifications": "can-change",
-            "revokable": "can-revoke",
-            "relicense": "relicense",
-            "disclose-source": "share-source",  # requirements
-            "document-changes": "describe-changes",
-            "include-copyright": "give-credit",
-            "same-license": "share-alike (strict)",
-            "same-license--file": "share-alike (relaxed)",
-            "same-license--library": "share-alike (relaxed)",
-        }
-
-    @cached_property
-    def icon_map(self) -> dict[str, str]:
-        """Returns the icon map for the license tab icons."""
-        return {
-            "reader": ":material-book-open-variant:",
-            "markdown": ":octicons-markdown-24:",
-            "plaintext": ":nounproject-txt:",
-            "embed": ":material-language-html5:",
-            "changelog": ":material-history:",
-            "official": ":material-license:",
-        }
-
     @cached_property
     def not_advice_text(self) -> str:
         """Returns the not advice text for the license."""
-        return dedent(f"""\
-            We are not lawyers. This is not legal advice. If you need legal advice, talk to a lawyer. You use this license at your own risk.
-
-            We are normal people who want to make licenses accessible for everyone. We hope that our plain language helps you and anyone else understand this license  (including lawyers). If you see a mistake or want to suggest a change, please [submit an issue on GitHub]({self.meta.get("github_issues_link")} "Submit an issue on GitHub") or [edit this page]({self.meta.get("github_edit_link")} "edit on GitHub").
-            """)
+        return _NOT_ADVICE_TEXT.format(
+            issues_link=self.meta.get("github_issues_link"),
+            edit_link=self.meta.get("github_edit_link"),
+        )
 
     @cached_property
     def not_official_text(self) -> str:
         """Returns the not official text for the license."""
         if self.has_official:
-            return dedent(f"""\
-            Plain License is not affiliated with the original {self.meta["original_name"].strip()} authors or {self.meta["original_organization"].strip()}. **Our plain language versions are not official** and are not endorsed by the original authors. Our licenses may also include different terms or additional information. We try to capture the *legal meaning* of the original license, but we can't guarantee our license provides the same legal protections.
-
-            If you want to use the {self.meta["plain_name"].strip()}, start by reading the official {self.meta["original_name"].strip()} license text. You can find the official {self.meta["original_name"].strip()} [here]({self.meta["original_url"].strip()} "check out the official {self.meta["original_name"].strip()}"). If you have questions about the {self.meta["original_name"].strip()}, you should talk to a lawyer.
-            """)
+            return _NOT_OFFICIAL_TEXT.format(
+                original_name=self.meta["original_name"].strip(),
+                original_organization=self.meta["original_organization"].strip(),
+                plain_name=self.meta["plain_name"].strip(),
+                original_url=self.meta["original_url"].strip(),
+            )
         return ""
 
-    @property
+    @cached_property
     def disclaimer_block(self) -> str:
         """Returns the disclaimer block for the license."""
         not_advice_title = "legal advice"
@@ -709,14 +962,14 @@ class LicenseContent:
                 self.not_advice_text, "tab" if self.has_official else "warning", not_advice_title, 3
             )
         not_advice = self.tabify(self.not_advice_text, not_advice_title, 1)
-        not_official_title = f"the official {self.meta.get('original_name')}"
+        not_official_title = f"the official {self.meta['original_name']}"
         not_official = self.tabify(self.not_official_text, not_official_title, 1)
         return (
-            f"<div class='admonition warning'><p class='admonition-title'>The {self.meta.get('plain_name', '')} isn't...</p>\n\n"
+            f"<div class='admonition warning'><p class='admonition-title'>The {self.meta['plain_name']} isn't...</p>\n\n"
             f"{not_advice}{not_official}</div>"
         )
 
-    @property
+    @cached_property
     def reader(self) -> str:
         """Returns the reader block for the license."""
         header_block = self.get_header_block("reader")
@@ -735,151 +988,55 @@ class LicenseContent:
                 """)
         return self.tabify(text, "reader", 1, self.icon_map["reader"])
 
-    @property
+    @cached_property
     def markdown(self) -> str:
         """Returns the markdown block for the license."""
         header_block = self.get_header_block("markdown")
         body = wrap_text(dedent(f"\n{self.markdown_license_text}\n"))
-        text = f"""\n\n```markdown title="{self.meta.get("plain_name", "")} in Github-style markdown"\n\n{header_block}\n\n{body}{wrap_text(self.interpretation_block("markdown"))}\n```\n\n{self.disclaimer_block}\n"""
+        text = f"""\n\n```markdown title="{self.meta["plain_name"]} in Github-style markdown"\n\n{header_block}\n\n{body}{wrap_text(self.interpretation_block("markdown"))}\n```\n\n{self.disclaimer_block}\n"""
         return self.tabify(text, "markdown", 1, self.icon_map["markdown"])
 
-    @property
+    @cached_property
     def plaintext(self) -> str:
         """Returns the plaintext block for the license."""
         header_block = self.get_header_block("plaintext")
         body = wrap_text(dedent(f"\n{self.plaintext_license_text}\n"))
-        text = f"""\n\n```plaintext title="{self.meta.get("plain_name", "")} in plain text"\n\n{header_block}\n\n{body}{wrap_text(self.interpretation_block("plaintext"))}\n```\n\n{self.disclaimer_block}\n"""
+        text = f"""\n\n```plaintext title="{self.meta["plain_name"]} in plain text"\n\n{header_block}\n\n{body}{wrap_text(self.interpretation_block("plaintext"))}\n```\n\n{self.disclaimer_block}\n"""
         return self.tabify(text, "plaintext", 1, self.icon_map["plaintext"])
 
-    @property
+    @cached_property
     def changelog(self) -> str:
         """Returns the changelog block for the license."""
         return self.tabify(self.changelog_text, "changelog", 1, self.icon_map["changelog"])
 
-    @property
+    @cached_property
     def official(self) -> str:
         """Returns the official block for the license."""
         if not self.has_official:
             return ""
-        text = (
-            f"{self.official_license_text}"
-            if self.meta.get("link_in_original")
-            else f"{self.official_license_text}\n\n{self.meta.get('official_link')}"
-        )
+        text = self.official_license_text
+        if not self.meta.get("link_in_original"):
+            text = f"{text}\n\n{self.meta.get('official_link')}"
         return self.tabify(text, "official", 1, self.icon_map["official"])
 
     @cached_property
     def embed_link(self) -> str:
         """Returns the embed link for the license."""
-        return dedent(f"""
-            # Embedding Your License
-
-            ```html title="add this to your site's html"
-
-            <iframe src="{self.embed_url}"
-            style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;
-            border: 1px solid #E4C580; border-radius: 8px; overflow: hidden auto;"
-            title="{self.title}" loading="lazy" sandbox="allow-scripts"
-            onload="if(this.contentDocument.body.scrollHeight > 400)
-            this.style.height = this.contentDocument.body.scrollHeight + 'px';"
-            referrerpolicy="no-referrer-when-downgrade">
-                <p>Your browser does not support iframes. View {self.title} at:
-                    <a href="{self.page.url}">
-                        plainlicense.org
-                    </a>
-                </p>
-            </iframe>
-
-            ```
-        """).strip()
+        return _EMBED_LINK.format(embed_url=self.embed_url, title=self.title, url=self.page.url)
 
     @cached_property
     def embed_instructions(self) -> str:
         """Returns the embed instructions for the license."""
-        return dedent(f"""
-
-            The above code will embed the license in your site. It uses an iframe to display the license as it appears on Plain License. This also sandboxes the license to prevent it from affecting your site.
-
-            1. **Copy the code above** using the copy button
-            2. **Paste it** into your HTML where you want the license to appear
-            3. **Adjust the size** (optional):
-
-               - The default width is 100% (fills the container)
-               - The default height is either the content height or 1024px, whichever is smaller.
-               - The next section provides more details on customizing the size.
-
-            ## Customizing Your Embedded License
-
-            ### Changing the Size
-
-            Common size adjustments in the `style` attribute:
-
-            ```html
-
-            <!-- Full width, taller -->
-            style="width: 100%; height: 800px;"
-
-            <!-- Fixed width, default height -->
-            style="width: 800px; height: 500px;"
-
-            <!-- Full width, minimum height -->
-            style="width: 100%; min-height: 500px;"
-
-            ```
-
-            ## Color Scheme Preference
-
-            The embedded license will match your visitors' system preferences for light or dark mode by default.
-
-            ### Forcing a Specific Theme
+        return self.embed_url.join(_EMBED_INSTRUCTIONS_PARTS)
 
-            To force a specific theme, add `?theme=` to the URL, along with `light` or `dark`:
-
-            - For light theme: `src="{self.embed_url}?theme=light"`
-            - For dark theme: `src="{self.embed_url}?theme=dark"`
-
-            ### Syncing the License Theme with Your Site (more advanced)
-
-            You can optionally sync the license's light/dark theme to your site's theme. You will need to send the embedded license page a message to tell it what theme your site is currently using. You can include this code in your script bundle or HTML:
-
-            ```javascript title="sync the light/dark theme with your site"
-
-            const syncTheme = () => {{
-            const iframe = document.getElementById("license-embed");
-            const theme = document.documentElement.classList.contains("dark") ? "dark" : "light";
-            iframe.contentWindow.postMessage({{ theme }}, "https://plainlicense.org");
-            }};
-
-            ```
-
-            If your site has a toggle switch for changing themes, you can link it to the embedded license. Set up the toggle to send a `themeChange` event and add a listener to dispatch the same message. We can't provide specific code for that because it depends on your setup.
-
-            Once your toggle switch is set up to send a `themeChange` event, you need to add a listener to dispatch the same message as before:
-
-            ```javascript title="toggle license theme with site theme"
-
-            const syncTheme = () => {{
-            const iframe = document.getElementById("license-embed");
-            const theme = document.documentElement.classList.contains("dark") ? "dark" : "light";
-            iframe.contentWindow.postMessage({{ theme }}, "https://plainlicense.org");
-            }};
-            document.addEventListener('themeChange', syncTheme);
-
-            ```
-
-            ## Need Help?
-
-            Bring your questions to our [GitHub Discussions](https://github.com/seekinginfiniteloop/PlainLicense/discussions "visit Plain License's discussions page") for help and support.
-            """)
-
-    @property
+    @cached_property
     def embed(self) -> str:
         """Returns the embed block for the license."""
         return self.tabify(
             f"{self.embed_link}{self.embed_instructions}", "html", 1, self.icon_map["embed"]
         )
 
-    @property
+    @cached_property
     def embed_file_markdown(self) -> str:
         """Returns the embed file markdown for the license."""
         text = dedent(f"""
@@ -889,24 +1046,20 @@ class LicenseContent:
         return self.blockify(
             text,
             "admonition",
-            f"Plain License: <span class='detail-title-highlight'>The {self.meta.get('plain_name')}</span>",
+            f"Plain License: {self.title_html}",
             3,
-            options={"type": "license"},
+            options=_LICENSE_BLOCK_OPTIONS,
         )
 
-    @property
+    @cached_property
     def license_content(self) -> str:
         """Returns the content for a license page."""
-        tabs = f"{self.reader}\n{self.embed}\n{self.markdown}\n{self.plaintext}\n{self.changelog}"
-        if self.has_official:
-            tabs += f"\n{self.official}"
-        outro = ("\n\n" + self.meta.get("outro", "") + "\n") if self.meta.get("outro") else "\n"
+        tabs = [self.reader, self.embed, self.markdown, self.plaintext, self.changelog]
+        if official := self.official:  # cached, and empty without an official text
+            tabs.append(official)
+        outro = f"\n\n{outro}\n" if (outro := self.meta.get("outro")) else "\n"
         return (
             self.blockify(
-                f"{tabs}",
-                "admonition",
-                f"<span class='detail-title-highlight'>The {self.meta.get('plain_name')}</span>",
-                6,
-                options={"type": "license"},
+                "\n".join(tabs), "admonition", self.title_html, 6, options=_LICENSE_BLOCK_OPTIONS
             )
         ) + outro
@@ -12,7 +12,7 @@ from functools import cached_property
 from typing import ClassVar, Self
 
 from _utils import is_license_page, strip_markdown
-from hook_logger import get_logger
+from hook_logger import FILE_ONLY, FILEHANDLER_ENABLED, get_logger
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
@@ -231,7 +231,7 @@ class ShameCounter:
         if not self.shame_map:
             shame_logger.warning("No shame words found in configuration.")
         else:
-            shame_logger.debug(f"Shame words loaded: {self.shame_map}")  # noqa: G004
+            shame_logger.debug("Shame words loaded: %s", self.shame_map)
         self.shame_counts: dict[str, Counter] = {}
         self.total_counts = Counter()
         self.ratios: dict[str, float] = {}
@@ -302,11 +302,13 @@ def on_page_markdown(markdown: str, page: Page, config: MkDocsConfig, files: Fil
 
         if word_count := Counter(word for word in filtered_words if word in shamer.shame_map):
             logger.debug(
-                "Found %d words in license text for %s. Words: %s",
+                "Found %d words in license text for %s. Shame words: %s",
                 len(filtered_words),
                 license_name,
-                filtered_words,
+                word_count,
             )
+            if FILEHANDLER_ENABLED and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Words in %s: %s", license_name, filtered_words, extra=FILE_ONLY)
             shamer.shame_counts[license_name] = word_count
             shamer.total_counts.update(word_count)
             shamer.ratios[license_name] = (
@@ -322,7 +324,7 @@ def on_page_markdown(markdown: str, page: Page, config: MkDocsConfig, files: Fil
             "shame_ratio": shamer.ratios[license_name],
         })
         shamer.sort_all()
-        logger.debug("Shame counts for %s: %d}", license_name, shamer.shame_counts[license_name])
+        logger.debug("Shame counts for %s: %s", license_name, shamer.shame_counts[license_name])
     return markdown
 
 
@@ -16,6 +16,9 @@ from mkdocs.utils.templates import TemplateContext
 
 _site_license_log_level = logging.WARNING
 
+if not hasattr(__name__, "site_license_logger"):
+    site_license_logger = get_logger("SITE_LICENSE", _site_license_log_level)
+
 
 def on_page_context(
     context: TemplateContext, page: Page, config: MkDocsConfig, nav: Navigation
@@ -34,21 +37,21 @@ def on_page_context(
     Returns:
         TemplateContext: The updated template context after processing the page.
     """
-    logger = get_logger("SITE_LICENSE", _site_license_log_level)
     if not (lcnse := is_license_page(page)):
         return context
-    logger.debug("site license checking license %s if it's an unlicense", license)
+    site_license_logger.debug("site license checking if %s is an unlicense", page.title)
     meta = page.meta
     if meta and "original_name" not in meta:
         return context
     if (original_name := meta["original_name"].strip().lower()) and (
         "unlicense" in original_name or original_name == "unlicense"
     ):
-        logger.info("found unlicense")
-        logger.debug("PATH: %s", Path.cwd())
+        site_license_logger.info("found unlicense")
+        if site_license_logger.isEnabledFor(logging.DEBUG):
+            site_license_logger.debug("PATH: %s", Path.cwd())
         lcnse = SiteLicense(context, page)
         lcnse.check_for_updates()
-        logger.debug("license: %s", lcnse.full_text)
+        site_license_logger.debug("license: %s", lcnse.full_text)
     return context
 
 
@@ -100,8 +103,6 @@ class SiteLicense:
         self.original_url = page.meta.get("original_url", "").strip()
         self._preamble = self.preamble
         self.full_text = f"{self._preamble}\n\n{self.title}\n\n{self.version_text}\n\n{self.text}\n\n{self.interpretation_section}\n\nOfficial Unlicense: [Unlicense.org]({self.original_url})"
-        self.logger = get_logger("SITELICENSE", _site_license_log_level)
-
         self.logger.debug("license full text: %s", self.full_text)
 
     @property
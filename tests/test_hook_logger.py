@@ -0,0 +1,108 @@
+"""
+Tests for the hook logger's end-of-build flush.
+
+mkdocs loads each hook with `importlib.util.spec_from_file_location` under its file path, while
+the other hooks import `hook_logger` by name, so a build has two copies of the module. Each test
+runs a build in a fresh interpreter with stdout redirected to a file (not a TTY), calls the hook
+copy's `on_post_build`, and then exits without running atexit handlers, so anything written had
+to come from that flush.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+from pathlib import Path
+
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "overrides" / "hooks"
+
+BUILD_SCRIPT = textwrap.dedent("""
+    import importlib.util
+    import os
+    import sys
+
+    hooks_dir = sys.argv[1]
+    sys.path.insert(0, hooks_dir)
+    import hook_logger  # the copy the other hooks import
+
+    # load the hook the way mkdocs does
+    path = os.path.join(hooks_dir, "hook_logger.py")
+    spec = importlib.util.spec_from_file_location("overrides/hooks/hook_logger.py", path)
+    hook = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = hook
+    spec.loader.exec_module(hook)
+
+    hook.on_startup("build", dirty=False)
+    logger = hook_logger.get_logger("TEST", 10)
+""")
+
+END_BUILD = textwrap.dedent("""
+    hook.on_post_build(None)
+    os._exit(0)
+""")
+
+LOG_CALLS = textwrap.dedent("""
+    logger.warning("hello from the build")
+    for _ in range(3):
+        logger.warning("again")
+""")
+
+
+def run_build(log_dir: Path, log_calls: str = LOG_CALLS) -> tuple[str, str]:
+    """Runs a build making `log_calls` and returns what reached stdout and the log file."""
+    env = os.environ | {
+        "FILEHANDLER_ENABLED": "true",
+        "LOG_PATH": str(log_dir),
+        "STREAMHANDLER_ENABLED": "true",
+    }
+    env.pop("LOG_LEVEL_OVERRIDE", None)
+    stdout_path = log_dir / "stdout.txt"
+    with stdout_path.open("w") as stdout:
+        subprocess.run(  # noqa: S603 - our own interpreter running a fixed script
+            [sys.executable, "-c", BUILD_SCRIPT + log_calls + END_BUILD, str(HOOKS_DIR)],
+            stdout=stdout,
+            stderr=subprocess.PIPE,
+            env=env,
+            check=True,
+        )
+    (log_file,) = log_dir.glob("pl_build_log_*.log")
+    return stdout_path.read_text(), log_file.read_text()
+
+
+def test_on_post_build_flushes_console_and_file_logs(tmp_path: Path) -> None:
+    """Buffered console and file records are written before the process exits."""
+    stdout, log_file = run_build(tmp_path)
+    for output in (stdout, log_file):
+        assert "hello from the build" in output
+        assert "previous message repeated 2 times" in output
+
+
+def test_bad_logging_call_does_not_stop_later_records(tmp_path: Path) -> None:
+    """Records after one that can't be formatted are still written."""
+    log_calls = textwrap.dedent("""
+        logger.warning("bad %s %s", "one")
+        logger.warning("still logging")
+    """)
+    stdout, log_file = run_build(tmp_path, log_calls)
+    for output in (stdout, log_file):
+        assert "still logging" in output
+
+
+def test_fork_after_logging_is_single_threaded(tmp_path: Path) -> None:
+    """The listener thread is stopped while a plugin forks, and logging picks up again after."""
+    log_calls = textwrap.dedent("""
+        import warnings
+        logger.warning("before fork")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")  # fork() warns if other threads are running
+            if (pid := os.fork()) == 0:
+                os._exit(0)
+            os.waitpid(pid, 0)
+        logger.warning("after fork, %d warnings", len(caught))
+    """)
+    stdout, log_file = run_build(tmp_path, log_calls)
+    for output in (stdout, log_file):
+        assert output.count("before fork") == 1
+        assert "after fork, 0 warnings" in output